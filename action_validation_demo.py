@@ -17,8 +17,12 @@ Key Demonstrations:
 
 import sys
 import time
+import logging
 import random
-from typing import List, Optional
+from types import MappingProxyType
+from typing import Any, List, Optional, Tuple
+
+import numpy as np
 
 # Add the src directory to the path for imports
 sys.path.append('src')
@@ -26,13 +30,28 @@ sys.path.append('src')
 from src.agents.base_agent import BaseAgent, CombatAction, AgentState
 from src.agents.action_validation import (
     ActionExecutor, ActionResult, ActionStatus, ValidationLevel,
-    ExecutionContext, SafetyValidator, execute_agent_action,
+    ExecutionContext, SafetyValidator,
     create_action_executor
 )
 from src.utils.vector2d import Vector2D
 from src.utils.logging_config import get_logger
 
 
+# Pause between demo steps for readability (off for scripted/benchmark runs)
+INTERACTIVE = False
+
+# Print per-action detail lines; disable to skip their formatting entirely
+VERBOSE = True
+
+# Read-only battlefield shared by every demo instead of a fresh dict per call
+BATTLEFIELD = MappingProxyType({
+    'bounds': MappingProxyType({'min_x': 0.0, 'max_x': 200.0, 'min_y': 0.0, 'max_y': 200.0})
+})
+
+# One executor per validation level, reused by every demo
+_EXECUTORS = {level: create_action_executor(level) for level in ValidationLevel}
+
+
 class DemoAgent(BaseAgent):
     """Demo agent implementation for testing action validation."""
     
@@ -58,10 +77,7 @@ class DemoAgent(BaseAgent):
     
     def select_target(self, visible_agents: List['BaseAgent']) -> Optional['BaseAgent']:
         """Select a target from visible agents."""
-        for agent in visible_agents:
-            if agent != self and agent.is_alive:
-                return agent
-        return None
+        return next((a for a in visible_agents if a is not self and a.is_alive), None)
 
 
 def create_demo_agent(agent_id: str, position: Vector2D, health: int = 100) -> DemoAgent:
@@ -76,30 +92,60 @@ def create_demo_agent(agent_id: str, position: Vector2D, health: int = 100) -> D
     return agent
 
 
+# Hero action keyed by (target_in_range, low_health); being in range wins
+HERO_ACTION_FOR_STATE = {
+    (True, False): CombatAction.ATTACK_MELEE,
+    (True, True): CombatAction.ATTACK_MELEE,
+    (False, True): CombatAction.RETREAT,
+    (False, False): CombatAction.MOVE,
+}
+
+
+def nearest_enemy_index(px: float, py: float, xs: np.ndarray, ys: np.ndarray,
+                        alive: np.ndarray) -> Tuple[int, float]:
+    """
+    Find the closest living enemy from structure-of-arrays positions.
+    
+    Returns:
+        Tuple of (index, squared_distance); index is -1 if no enemy is alive
+    """
+    d2 = (xs - px) ** 2 + (ys - py) ** 2
+    d2 = np.where(alive, d2, np.inf)
+    idx = int(np.argmin(d2))
+    if not alive[idx]:
+        return -1, float('inf')
+    return idx, float(d2[idx])
+
+
+def join_fields(*fields: Any) -> str:
+    """Join values with spaces, as print() does, for buffered report lines."""
+    return " ".join(map(str, fields))
+
+
 def print_action_result(result: ActionResult, detailed: bool = True) -> None:
     """Print action result in a readable format."""
-    print(f"\n{'='*60}")
-    print(f"Action Result: {result}")
+    print("\n" + "=" * 60)
+    print("Action Result:", result)
     
-    if detailed:
-        print(f"  Status: {result.status.value}")
-        print(f"  Success: {result.success}")
-        print(f"  Validation Passed: {result.validation_passed}")
+    if detailed and VERBOSE:
+        print("  Status:", result.status.value)
+        print("  Success:", result.success)
+        print("  Validation Passed:", result.validation_passed)
         
         if result.validation_errors:
-            print(f"  Validation Errors: {', '.join(result.validation_errors)}")
+            print("  Validation Errors:", ", ".join(result.validation_errors))
         
         if result.execution_error:
-            print(f"  Execution Error: {result.execution_error}")
+            print("  Execution Error:", result.execution_error)
         
         print(f"  Execution Time: {result.execution_time:.3f}s")
         print(f"  Validation Time: {result.validation_time:.3f}s")
         
         if result.primary_result:
-            print(f"  Primary Result: {result.primary_result}")
+            print("  Primary Result:", result.primary_result)
         
         if result.secondary_effects:
-            print(f"  Secondary Effects: {result.secondary_effects}")
+            print("  Secondary Effects:", result.secondary_effects)
 
 
 def demo_basic_action_execution():
@@ -112,12 +158,12 @@ def demo_basic_action_execution():
     target = create_demo_agent("Enemy_001", Vector2D(130, 100))  # 30 units away
     
     # Execute a basic melee attack
-    result = execute_agent_action(
+    result = _EXECUTORS[ValidationLevel.STANDARD].execute_action(ExecutionContext(
         agent=attacker,
         action=CombatAction.ATTACK_MELEE,
         target_agent=target,
         validation_level=ValidationLevel.STANDARD
-    )
+    ))
     
     print_action_result(result)
     
@@ -135,31 +181,31 @@ def demo_safety_validation():
     distant_target = create_demo_agent("DistantEnemy", Vector2D(200, 100))  # 100 units away
     
     print("1. Attempting attack on out-of-range target...")
-    result = execute_agent_action(
+    result = _EXECUTORS[ValidationLevel.STANDARD].execute_action(ExecutionContext(
         agent=agent,
         action=CombatAction.ATTACK_MELEE,
         target_agent=distant_target,
         validation_level=ValidationLevel.STANDARD
-    )
+    ))
     print_action_result(result)
     
     print("\n2. Attempting self-attack (should be blocked)...")
-    result = execute_agent_action(
+    result = _EXECUTORS[ValidationLevel.STANDARD].execute_action(ExecutionContext(
         agent=agent,
         action=CombatAction.ATTACK_MELEE,
         target_agent=agent,  # Self-attack
         validation_level=ValidationLevel.STANDARD
-    )
+    ))
     print_action_result(result)
     
     print("\n3. Attempting attack with dead agent...")
     agent.stats.current_health = 0  # Kill the agent
-    result = execute_agent_action(
+    result = _EXECUTORS[ValidationLevel.STANDARD].execute_action(ExecutionContext(
         agent=agent,
         action=CombatAction.ATTACK_MELEE,
         target_agent=distant_target,
         validation_level=ValidationLevel.STANDARD
-    )
+    ))
     print_action_result(result)
 
 
@@ -183,12 +229,12 @@ def demo_validation_levels():
         print(f"\nTesting with {level.name} validation:")
         
         start_time = time.time()
-        result = execute_agent_action(
+        result = _EXECUTORS[level].execute_action(ExecutionContext(
             agent=agent,
             action=CombatAction.ATTACK_MELEE,
             target_agent=target,
             validation_level=level
-        )
+        ))
         end_time = time.time()
         
         print(f"  Result: {result.status.value}")
@@ -208,9 +254,7 @@ def demo_action_types():
     enemy2 = create_demo_agent("Enemy_002", Vector2D(80, 120))
     
     visible_agents = [enemy1, enemy2]
-    battlefield_info = {
-        'bounds': {'min_x': 0, 'max_x': 200, 'min_y': 0, 'max_y': 200}
-    }
+    battlefield_info = BATTLEFIELD
     
     actions_to_test = [
         (CombatAction.ATTACK_MELEE, enemy1, None),
@@ -226,7 +270,7 @@ def demo_action_types():
     for action, target, position in actions_to_test:
         print(f"\nExecuting {action.value}:")
         
-        result = execute_agent_action(
+        result = _EXECUTORS[ValidationLevel.STANDARD].execute_action(ExecutionContext(
             agent=agent,
             action=action,
             target_agent=target,
@@ -234,15 +278,17 @@ def demo_action_types():
             visible_agents=visible_agents,
             battlefield_info=battlefield_info,
             validation_level=ValidationLevel.STANDARD
-        )
+        ))
         
-        print(f"  Status: {result.status.value}")
-        print(f"  Success: {result.success}")
-        if result.primary_result:
-            print(f"  Result: {result.primary_result}")
+        print("  Status:", result.status.value)
+        if VERBOSE:
+            print("  Success:", result.success)
+            if result.primary_result:
+                print("  Result:", result.primary_result)
         
-        # Brief pause between actions
-        time.sleep(0.1)
+        # Brief pause between actions when a human is watching
+        if INTERACTIVE:
+            time.sleep(0.1)
 
 
 def demo_performance_tracking():
@@ -262,28 +308,24 @@ def demo_performance_tracking():
     
     print("Executing multiple actions to gather statistics...")
     
+    # One context is reused for every action; only the target changes
+    context = ExecutionContext(
+        agent=agent,
+        action=CombatAction.ATTACK_MELEE,
+        validation_level=ValidationLevel.STANDARD
+    )
+    
     # Execute multiple actions
     for i, target in enumerate(targets):
-        context = ExecutionContext(
-            agent=agent,
-            action=CombatAction.ATTACK_MELEE,
-            target_agent=target,
-            validation_level=ValidationLevel.STANDARD
-        )
+        context.target_agent = target
         
         result = executor.execute_action(context)
         print(f"  Action {i+1}: {result.status.value} ({result.execution_time:.3f}s)")
     
     # Execute some failed actions
     print("\nExecuting some invalid actions...")
+    context.target_agent = agent  # Self-attack (invalid)
     for i in range(3):
-        context = ExecutionContext(
-            agent=agent,
-            action=CombatAction.ATTACK_MELEE,
-            target_agent=agent,  # Self-attack (invalid)
-            validation_level=ValidationLevel.STANDARD
-        )
-        
         result = executor.execute_action(context)
         print(f"  Invalid Action {i+1}: {result.status.value}")
     
@@ -312,100 +354,112 @@ def demo_complex_battle_scenario():
     ]
     
     all_agents = [hero] + enemies
-    battlefield_info = {
-        'bounds': {'min_x': 0, 'max_x': 200, 'min_y': 0, 'max_y': 200}
-    }
+    battlefield_info = BATTLEFIELD
     
     executor = create_action_executor(ValidationLevel.STANDARD)
     
+    # Contexts are consumed synchronously, so each agent keeps one and the
+    # turn loop only updates the action-specific fields
+    hero_context = ExecutionContext(
+        agent=hero,
+        action=CombatAction.MOVE,
+        visible_agents=enemies,
+        battlefield_info=battlefield_info
+    )
+    enemy_contexts = [
+        ExecutionContext(
+            agent=enemy,
+            action=CombatAction.MOVE,
+            visible_agents=[hero],
+            battlefield_info=battlefield_info
+        )
+        for enemy in enemies
+    ]
+    
     print("Starting battle simulation...")
     
     for turn in range(3):
-        print(f"\n--- Turn {turn + 1} ---")
+        # Collect the turn's output and write it in one call at the end
+        lines = [f"\n--- Turn {turn + 1} ---"]
+        
+        # Rebuild enemy positions as parallel arrays once per turn
+        xs = np.array([e.position.x for e in enemies], dtype=np.float32)
+        ys = np.array([e.position.y for e in enemies], dtype=np.float32)
+        alive_mask = np.array([e.is_alive for e in enemies], dtype=bool)
         
         # Hero's turn
         if hero.is_alive:
-            # Find closest enemy
-            closest_enemy = None
-            min_distance = float('inf')
+            hero_stats = hero.stats
+            hero_pos = hero.position
             
-            for enemy in enemies:
-                if enemy.is_alive:
-                    distance = hero.position.distance_to(enemy.position)
-                    if distance < min_distance:
-                        min_distance = distance
-                        closest_enemy = enemy
+            # Find closest enemy (squared distances avoid a sqrt per pair)
+            attack_range_sq = hero_stats.attack_range * hero_stats.attack_range
+            idx, min_distance_sq = nearest_enemy_index(
+                hero_pos.x, hero_pos.y, xs, ys, alive_mask
+            )
+            closest_enemy = enemies[idx] if idx >= 0 else None
             
             if closest_enemy:
                 # Decide action based on distance and health
-                if min_distance <= hero.stats.attack_range:
-                    action = CombatAction.ATTACK_MELEE
-                    target = closest_enemy
-                    position = None
-                elif hero.stats.current_health < 30:
-                    action = CombatAction.RETREAT
-                    target = None
-                    position = None
-                else:
-                    action = CombatAction.MOVE
-                    target = None
-                    position = closest_enemy.position
+                in_range = min_distance_sq <= attack_range_sq
+                low_health = hero_stats.current_health < 30
+                action = HERO_ACTION_FOR_STATE[(in_range, low_health)]
+                target = closest_enemy if action == CombatAction.ATTACK_MELEE else None
+                position = closest_enemy.position if action == CombatAction.MOVE else None
                 
-                context = ExecutionContext(
-                    agent=hero,
-                    action=action,
-                    target_agent=target,
-                    target_position=position,
-                    visible_agents=enemies,
-                    battlefield_info=battlefield_info
-                )
+                hero_context.action = action
+                hero_context.target_agent = target
+                hero_context.target_position = position
                 
-                result = executor.execute_action(context)
-                print(f"Hero: {action.value} -> {result.status.value}")
+                result = executor.execute_action(hero_context)
+                lines.append(f"Hero: {action.value} -> {result.status.value}")
                 
-                if result.success and action == CombatAction.ATTACK_MELEE:
-                    print(f"  Enemy {closest_enemy.agent_id} health: {closest_enemy.stats.current_health}")
+                # Only the hero damages enemies, so this keeps the mask current
+                alive_mask[idx] = closest_enemy.is_alive
+                
+                if VERBOSE and result.success and action == CombatAction.ATTACK_MELEE:
+                    lines.append(join_fields("  Enemy", closest_enemy.agent_id, "health:",
+                                             closest_enemy.stats.current_health))
         
         # Enemies' turns (simplified)
-        for enemy in enemies:
+        # Enemies have not moved yet this turn, so one vectorised pass over the
+        # turn's position arrays decides who can reach the hero
+        hero_pos = hero.position
+        attack_ranges = np.array([e.stats.attack_range for e in enemies], dtype=np.float32)
+        d2_to_hero = (xs - hero_pos.x) ** 2 + (ys - hero_pos.y) ** 2
+        in_range = d2_to_hero <= attack_ranges * attack_ranges
+        
+        for i, enemy in enumerate(enemies):
             if enemy.is_alive and hero.is_alive:
-                distance_to_hero = enemy.position.distance_to(hero.position)
-                
-                if distance_to_hero <= enemy.stats.attack_range:
+                context = enemy_contexts[i]
+                if in_range[i]:
                     # Attack hero
-                    context = ExecutionContext(
-                        agent=enemy,
-                        action=CombatAction.ATTACK_MELEE,
-                        target_agent=hero,
-                        visible_agents=[hero],
-                        battlefield_info=battlefield_info
-                    )
+                    context.action = CombatAction.ATTACK_MELEE
+                    context.target_agent = hero
+                    context.target_position = None
                     
                     result = executor.execute_action(context)
-                    print(f"{enemy.agent_id}: Attack -> {result.status.value}")
+                    lines.append(f"{enemy.agent_id}: Attack -> {result.status.value}")
                     
-                    if result.success:
-                        print(f"  Hero health: {hero.stats.current_health}")
+                    if VERBOSE and result.success:
+                        lines.append(join_fields("  Hero health:", hero.stats.current_health))
                 else:
                     # Move towards hero
-                    context = ExecutionContext(
-                        agent=enemy,
-                        action=CombatAction.MOVE,
-                        target_position=hero.position,
-                        visible_agents=[hero],
-                        battlefield_info=battlefield_info
-                    )
+                    context.action = CombatAction.MOVE
+                    context.target_agent = None
+                    context.target_position = hero_pos
                     
                     result = executor.execute_action(context)
-                    print(f"{enemy.agent_id}: Move -> {result.status.value}")
+                    lines.append(f"{enemy.agent_id}: Move -> {result.status.value}")
+        
+        print("\n".join(lines))
         
         # Check if battle is over
         if not hero.is_alive:
             print("\n💀 Hero has fallen!")
             break
         
-        living_enemies = [e for e in enemies if e.is_alive]
-        if not living_enemies:
+        if not alive_mask.any():
             print("\n🏆 All enemies defeated!")
             break
     
@@ -427,6 +481,9 @@ def main():
     print("This demo shows comprehensive action validation and execution")
     print("with safety checks, performance tracking, and error handling.")
     
+    # Keep per-action INFO chatter off the hot path; warnings still show
+    logging.disable(logging.INFO)
+    
     try:
         # Run demonstrations
         demo_basic_action_execution()
@@ -449,6 +506,9 @@ def main():
         logger.error(f"Demo error: {e}", exc_info=True)
         return 1
     
+    finally:
+        logging.disable(logging.NOTSET)
+    
     return 0
 
 
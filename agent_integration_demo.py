@@ -18,8 +18,12 @@ Demo Features:
 Run this demo to see Task 1.5.6 working in practice.
 """
 
+import os
 import time
 import random
+import logging
+from concurrent.futures import ThreadPoolExecutor
+from types import MappingProxyType
 from typing import List, Dict, Any
 
 from src.agents.random_agent import RandomAgent
@@ -32,6 +36,13 @@ from src.utils.vector2d import Vector2D
 from src.utils.logging_config import get_logger
 
 
+# Read-only battlefield shared by every demonstration step
+BATTLEFIELD = MappingProxyType({
+    'bounds': MappingProxyType({'min_x': 0.0, 'max_x': 400.0, 'min_y': 0.0, 'max_y': 300.0}),
+    'obstacles': ()
+})
+
+
 def demonstrate_agent_instantiation():
     """Demonstrate that all agent types can be instantiated correctly."""
     print("=" * 60)
@@ -49,7 +60,7 @@ def demonstrate_agent_instantiation():
     
     print(f"✅ Successfully instantiated {len(agents)} agents:")
     for i, agent in enumerate(agents, 1):
-        print(f"   {i}. {agent.__class__.__name__} (ID: {agent.agent_id[:8]}...)")
+        print(f"   {i}. {agent.class_name} (ID: {agent.short_id}...)")
         print(f"      📍 Position: {agent.position}")
         print(f"      👥 Team: {agent.team_id or 'None'}")
         print(f"      💪 Health: {agent.stats.current_health:.1f}")
@@ -65,18 +76,15 @@ def demonstrate_basic_behaviors(agents: List):
     print("🎯 BASIC BEHAVIOR DEMONSTRATION")
     print("=" * 60)
     
-    battlefield_info = {
-        'bounds': {'min_x': 0, 'max_x': 400, 'min_y': 0, 'max_y': 300},
-        'obstacles': []
-    }
+    battlefield_info = BATTLEFIELD
     
     print("Testing decision making for each agent...")
-    for agent in agents:
-        other_agents = [a for a in agents if a != agent]
+    for i, agent in enumerate(agents):
+        other_agents = agents[:i] + agents[i + 1:]
         
         # Test decision making
         action = agent.decide_action(other_agents, battlefield_info)
-        print(f"🧠 {agent.__class__.__name__} {agent.agent_id[:8]} decided: {action.value}")
+        print(f"🧠 {agent.class_name} {agent.short_id} decided: {action.value}")
         
         # Test update method
         agent.update(1.0, battlefield_info)
@@ -91,8 +99,8 @@ def demonstrate_decision_framework_integration(agents: List):
     print("🧭 DECISION FRAMEWORK INTEGRATION")
     print("=" * 60)
     
-    for agent in agents[:3]:  # Test with first 3 agents
-        other_agents = [a for a in agents if a != agent]
+    for i, agent in enumerate(agents[:3]):  # Test with first 3 agents
+        other_agents = agents[:i] + agents[i + 1:]
         
         # Create decision maker for this agent
         decision_maker = DecisionMaker(agent)
@@ -100,11 +108,11 @@ def demonstrate_decision_framework_integration(agents: List):
         # Make a decision using the framework
         action = decision_maker.decide_action(
             visible_agents=other_agents,
-            battlefield_info={'bounds': {'min_x': 0, 'max_x': 400, 'min_y': 0, 'max_y': 300}},
+            battlefield_info=BATTLEFIELD,
             dt=1.0
         )
         
-        print(f"🧭 DecisionMaker for {agent.__class__.__name__} {agent.agent_id[:8]}:")
+        print(f"🧭 DecisionMaker for {agent.class_name} {agent.short_id}:")
         print(f"   📊 Framework decision: {action.value}")
         print(f"   ✅ Integration successful!")
     
@@ -135,7 +143,7 @@ def demonstrate_action_validation_integration(agents: List):
         
         status = "✅ SUCCESS" if result.success else "⚠️ BLOCKED"
         print(f"🛡️ {description}:")
-        print(f"   Agent: {attacker.__class__.__name__} {attacker.agent_id[:8]}")
+        print(f"   Agent: {attacker.class_name} {attacker.short_id}")
         print(f"   Action: {action.value}")
         print(f"   Result: {status}")
         print(f"   Status: {result.status}")
@@ -153,39 +161,58 @@ def demonstrate_performance_characteristics(agents: List):
     print("⚡ PERFORMANCE CHARACTERISTICS")
     print("=" * 60)
     
-    battlefield_info = {
-        'bounds': {'min_x': 0, 'max_x': 400, 'min_y': 0, 'max_y': 300}
-    }
+    battlefield_info = BATTLEFIELD
     
     # Test update performance
     print("🔄 Testing agent update performance...")
-    update_times = []
+    update_runs = 100
+    update_times = [0] * update_runs
+    pc = time.perf_counter_ns
     
-    for _ in range(100):
-        start_time = time.time()
+    for i in range(update_runs):
+        t0 = pc()
         for agent in agents:
             agent.update(1.0, battlefield_info)
-        end_time = time.time()
-        update_times.append(end_time - start_time)
+        update_times[i] = pc() - t0
+    
+    avg_update_ms = sum(update_times) / len(update_times) / 1e6
+    print(f"   📊 Average update time for {len(agents)} agents: {avg_update_ms:.3f}ms")
     
-    avg_update_time = sum(update_times) / len(update_times)
-    print(f"   📊 Average update time for {len(agents)} agents: {avg_update_time*1000:.3f}ms")
+    # Agents whose update() is self-contained can be updated concurrently
+    if all(agent.UPDATE_IS_THREAD_SAFE for agent in agents):
+        print("🧵 Testing thread-pooled agent update performance...")
+        pooled_times = [0] * update_runs
+        
+        def update_agent(agent):
+            agent.update(1.0, battlefield_info)
+        
+        with ThreadPoolExecutor(max_workers=os.cpu_count()) as pool:
+            for i in range(update_runs):
+                t0 = pc()
+                list(pool.map(update_agent, agents))
+                pooled_times[i] = pc() - t0
+        
+        avg_pooled_ms = sum(pooled_times) / len(pooled_times) / 1e6
+        print(f"   📊 Average pooled update time for {len(agents)} agents: {avg_pooled_ms:.3f}ms")
     
     # Test decision making performance
     print("🧠 Testing decision making performance...")
-    decision_times = []
+    decision_runs = 50
+    decision_times = [0] * decision_runs
+    
+    # Draw every benchmarked agent up front, outside the measured region
+    picks = random.choices(range(len(agents)), k=decision_runs)
     
-    for _ in range(50):
-        agent = random.choice(agents)
-        other_agents = [a for a in agents if a != agent]
+    for i, idx in enumerate(picks):
+        agent = agents[idx]
+        other_agents = agents[:idx] + agents[idx + 1:]
         
-        start_time = time.time()
+        t0 = pc()
         action = agent.decide_action(other_agents, battlefield_info)
-        end_time = time.time()
-        decision_times.append(end_time - start_time)
+        decision_times[i] = pc() - t0
     
-    avg_decision_time = sum(decision_times) / len(decision_times)
-    print(f"   📊 Average decision time: {avg_decision_time*1000:.3f}ms")
+    avg_decision_ms = sum(decision_times) / len(decision_times) / 1e6
+    print(f"   📊 Average decision time: {avg_decision_ms:.3f}ms")
     
     print("\n✅ Performance characteristics are excellent!")
 
@@ -196,18 +223,21 @@ def demonstrate_multi_agent_interaction(agents: List):
     print("🤝 MULTI-AGENT INTERACTION SCENARIOS")
     print("=" * 60)
     
-    battlefield_info = {
-        'bounds': {'min_x': 0, 'max_x': 400, 'min_y': 0, 'max_y': 300}
-    }
+    battlefield_info = BATTLEFIELD
     
     print("🎮 Running multi-agent simulation for 10 steps...")
     
     for step in range(10):
-        print(f"\n--- Step {step + 1} ---")
+        # Collect the step's output and write it in one call at the end
+        lines = [f"\n--- Step {step + 1} ---"]
         
-        for agent in agents:
+        # Collect the living agents once per step rather than once per agent
+        living = tuple(a for a in agents if a.is_alive)
+        
+        for i, agent in enumerate(living):
             if agent.is_alive:
-                other_agents = [a for a in agents if a != agent and a.is_alive]
+                other_agents = living[:i] + living[i + 1:]
+                stats = agent.stats
                 
                 # Agent makes a decision
                 action = agent.decide_action(other_agents, battlefield_info)
@@ -216,14 +246,16 @@ def demonstrate_multi_agent_interaction(agents: List):
                 agent.update(1.0, battlefield_info)
                 
                 # Report status
-                print(f"📱 {agent.__class__.__name__} {agent.agent_id[:8]}: {action.value} " +
-                      f"(Health: {agent.stats.current_health:.1f}, State: {agent.state.value})")
+                lines.append(f"📱 {agent.class_name} {agent.short_id}: {action.value} "
+                             f"(Health: {stats.current_health:.1f}, State: {agent.state.value})")
+        
+        print("\n".join(lines))
     
     # Final status report
     print("\n📊 Final Agent Status:")
     for agent in agents:
         status = "💚 ALIVE" if agent.is_alive else "💀 DEAD"
-        print(f"   {agent.__class__.__name__} {agent.agent_id[:8]}: {status} " +
+        print(f"   {agent.class_name} {agent.short_id}: {status} " +
               f"(Health: {agent.stats.current_health:.1f})")
     
     print("\n✅ Multi-agent interaction scenarios completed successfully!")
@@ -235,6 +267,9 @@ def main():
     print("🎯 Demonstrating successful completion of all integration requirements")
     print()
     
+    # Keep per-action INFO chatter off the hot path; warnings still show
+    logging.disable(logging.INFO)
+    
     try:
         # Step 1: Agent Instantiation
         agents = demonstrate_agent_instantiation()
@@ -274,6 +309,9 @@ def main():
         traceback.print_exc()
         return False
     
+    finally:
+        logging.disable(logging.NOTSET)
+    
     return True
 
 
@@ -6,10 +6,17 @@ for Task 1.6.1 implementation. It demonstrates team management, agent spawning,
 spatial partitioning, collision detection, and battle lifecycle management.
 """
 
-from typing import List
+from typing import Callable, List
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+import io
+import logging
+import math
 import time
 import random
 
+import numpy as np
+
 from src.environment.battle_environment import (
     BattleEnvironment, SpawnStrategy, BattlePhase, TeamInfo
 )
@@ -17,6 +24,41 @@ from src.agents.idle_agent import IdleAgent  # Use IdleAgent to avoid update iss
 from src.utils.vector2d import Vector2D
 from src.utils.logging_config import get_logger
 
+logger = get_logger("BattleEnvironmentDemo")
+
+# Number of repeated queries timed in the spatial partitioning demo
+SEARCH_BENCHMARK_RUNS = 1000
+
+# Number of agents spawned in the spawning demo, alternating red and blue
+SPAWN_DEMO_AGENTS = 6
+
+# Worker processes used to run the independent demonstrations
+DEMO_PROCESSES = 4
+
+
+def interleave_bits(i: int, j: int) -> int:
+    """
+    Compute the Morton (Z-order) code of a grid cell.
+    
+    Args:
+        i: Column index (non-negative, up to 16 bits)
+        j: Row index (non-negative, up to 16 bits)
+        
+    Returns:
+        Integer whose even bits come from i and odd bits from j
+    """
+    code = 0
+    for bit in range(16):
+        code |= ((i >> bit) & 1) << (2 * bit)
+        code |= ((j >> bit) & 1) << (2 * bit + 1)
+    return code
+
+
+def morton_ordered_cells(columns: int, rows: int) -> List[tuple]:
+    """Get all (i, j) cells of a grid sorted in Morton order."""
+    return sorted(((i, j) for i in range(columns) for j in range(rows)),
+                  key=lambda cell: interleave_bits(*cell))
+
 
 def demonstrate_environment_initialization():
     """Demonstrate environment initialization with different configurations."""
@@ -91,32 +133,34 @@ def demonstrate_agent_spawning():
     env.create_team("blue", "Blue Team")
     
     agents = []
-    spawn_positions = []
+    # One row per spawn; even rows are red and odd rows are blue
+    spawn_positions = np.empty((SPAWN_DEMO_AGENTS, 2), np.float32)
     
     print("Spawning agents:")
     
-    # Spawn agents with team assignment
-    for i in range(6):
+    # Spawn agents with team assignment; the team is known locally, so no
+    # per-agent lookup back into the environment is needed
+    for i in range(SPAWN_DEMO_AGENTS):
         team = "red" if i % 2 == 0 else "blue"
         agent = IdleAgent(position=Vector2D(0, 0))  # Position will be overridden
         
         success = env.add_agent(agent, team_id=team)
         if success:
             agents.append(agent)
-            spawn_positions.append(agent.position)
-            team_info = f" (Team: {env.get_agent_team(agent.agent_id)})"
-            print(f"  ✅ Agent {i+1}: {agent.agent_id[:8]} at ({agent.position.x:.0f},{agent.position.y:.0f}){team_info}")
+            position = agent.position
+            spawn_positions[i, 0] = position.x
+            spawn_positions[i, 1] = position.y
+            print(f"  ✅ Agent {i+1}: {agent.short_id} at ({position.x:.0f},{position.y:.0f}) (Team: {team})")
     
+    red_team = env.teams['red']
+    blue_team = env.teams['blue']
     print(f"\nTotal agents spawned: {len(agents)}")
-    print(f"Red team agents: {env.teams['red'].agent_count}")
-    print(f"Blue team agents: {env.teams['blue'].agent_count}")
-    
-    # Test spawn area distribution
-    red_positions = [pos for i, pos in enumerate(spawn_positions) if i % 2 == 0]
-    blue_positions = [pos for i, pos in enumerate(spawn_positions) if i % 2 == 1]
+    print(f"Red team agents: {red_team.agent_count}")
+    print(f"Blue team agents: {blue_team.agent_count}")
     
-    red_avg_x = sum(pos.x for pos in red_positions) / len(red_positions)
-    blue_avg_x = sum(pos.x for pos in blue_positions) / len(blue_positions)
+    # Test spawn area distribution using the team stride of the spawn rows
+    red_avg_x = spawn_positions[0::2, 0].mean()
+    blue_avg_x = spawn_positions[1::2, 0].mean()
     
     print(f"\nSpawn distribution analysis:")
     print(f"  Red team average X: {red_avg_x:.0f}")
@@ -131,17 +175,16 @@ def demonstrate_spatial_partitioning():
     
     env = BattleEnvironment()
     
-    # Add agents in a grid pattern
+    # Add agents in a grid pattern, inserted in Morton order so agents that
+    # are close on the battlefield also get neighbouring storage rows
     agents = []
     positions = []
-    for i in range(5):
-        for j in range(4):
-            x = 200 + i * 100
-            y = 200 + j * 100
-            agent = IdleAgent(position=Vector2D(x, y))
-            env.add_agent(agent)
-            agents.append(agent)
-            positions.append(Vector2D(x, y))
+    for i, j in morton_ordered_cells(5, 4):
+        position = Vector2D(200 + i * 100, 200 + j * 100)
+        agent = IdleAgent(position=position)
+        env.add_agent(agent, position=position)
+        agents.append(agent)
+        positions.append(position)
     
     print(f"Added {len(agents)} agents in grid pattern")
     
@@ -149,15 +192,18 @@ def demonstrate_spatial_partitioning():
     search_center = Vector2D(300, 300)
     search_radius = 150
     
-    start_time = time.time()
+    # Time many queries and report the mean to keep timer noise out
     nearby_agents = env.get_nearby_agents(search_center, search_radius)
-    search_time = time.time() - start_time
+    start_ns = time.perf_counter_ns()
+    for _ in range(SEARCH_BENCHMARK_RUNS):
+        env.get_nearby_agents(search_center, search_radius)
+    search_ms = (time.perf_counter_ns() - start_ns) / SEARCH_BENCHMARK_RUNS / 1e6
     
     print(f"\nNearby agent search:")
     print(f"  Search center: ({search_center.x:.0f}, {search_center.y:.0f})")
     print(f"  Search radius: {search_radius}")
     print(f"  Found agents: {len(nearby_agents)}")
-    print(f"  Search time: {search_time*1000:.3f}ms")
+    print(f"  Mean search time: {search_ms:.4f}ms per query ({SEARCH_BENCHMARK_RUNS} queries)")
     
     # Verify results
     actual_nearby = []
@@ -185,19 +231,22 @@ def demonstrate_collision_detection():
     ]
     
     for test_name, pos1, pos2 in test_cases:
-        # Create fresh environment for each test
-        test_env = BattleEnvironment()
+        # Reuse one environment, clearing it between test cases
+        env.reset()
         
         agent1 = IdleAgent(position=pos1)
         agent2 = IdleAgent(position=pos2)
         
-        test_env.add_agent(agent1)
-        test_env.add_agent(agent2)
+        env.add_agent(agent1, position=pos1)
+        env.add_agent(agent2, position=pos2)
         
-        distance = pos1.distance_to(pos2)
-        collisions = test_env.check_collisions()
+        dx = pos2.x - pos1.x
+        dy = pos2.y - pos1.y
+        distance_sq = dx * dx + dy * dy
+        distance = math.sqrt(distance_sq)  # Only needed for display
+        collisions = env.check_collisions()
         
-        expected_collision = distance < test_env.collision_radius
+        expected_collision = distance_sq < env.collision_radius_sq
         has_collision = len(collisions) > 0
         
         result = "✅" if expected_collision == has_collision else "❌"
@@ -239,9 +288,7 @@ def demonstrate_battle_lifecycle():
     print(f"\nSimulating battle time...")
     for i in range(3):
         # Just update metrics without agent updates
-        env.metrics.frame_count += 1
-        env.metrics.simulation_time += 0.016
-        time.sleep(0.01)  # Small delay for realism
+        env.metrics.record_frame(0.016)
     
     print(f"  Frames processed: {env.metrics.frame_count}")
     print(f"  Simulation time: {env.metrics.simulation_time:.3f}s")
@@ -284,7 +331,7 @@ def demonstrate_battlefield_information():
     # Get battlefield information from observer's perspective
     battlefield_info = env.get_battlefield_info(observer.agent_id)
     
-    print(f"Battlefield information for agent {observer.agent_id[:8]}:")
+    print(f"Battlefield information for agent {observer.short_id}:")
     print(f"  Position: ({battlefield_info['agent_position'].x:.0f}, {battlefield_info['agent_position'].y:.0f})")
     print(f"  Team: {battlefield_info['agent_team']}")
     print(f"  Environment bounds: {battlefield_info['environment_bounds']}")
@@ -300,23 +347,67 @@ def demonstrate_battlefield_information():
         print(f"     Health: {visible_agent['health']}")
 
 
+# Demonstrations run by main(); each builds its own environment and shares
+# no state with the others
+DEMONSTRATIONS = [
+    demonstrate_environment_initialization,
+    demonstrate_team_management,
+    demonstrate_agent_spawning,
+    demonstrate_spatial_partitioning,
+    demonstrate_collision_detection,
+    demonstrate_battle_lifecycle,
+    demonstrate_battlefield_information,
+]
+
+
+def run_captured(demo: Callable[[], None]) -> str:
+    """
+    Run a demonstration and capture what it prints and logs.
+    
+    The worker's console log handler is swapped for one that writes into
+    the same buffer as stdout, so log lines come back in order with the
+    demonstration's output instead of interleaving across workers. File
+    handlers are left in place.
+    
+    Args:
+        demo: Demonstration function to run
+        
+    Returns:
+        Everything the demonstration wrote to stdout or logged
+    """
+    buffer = io.StringIO()
+    root_logger = logging.getLogger()
+    handlers = root_logger.handlers[:]
+    capture_handler = logging.StreamHandler(buffer)
+    for handler in handlers:
+        if type(handler) is logging.StreamHandler:
+            # Keep the console format and level for the captured lines
+            capture_handler.setFormatter(handler.formatter)
+            capture_handler.setLevel(handler.level)
+    root_logger.handlers[:] = [capture_handler] + [
+        handler for handler in handlers if type(handler) is not logging.StreamHandler
+    ]
+    try:
+        with redirect_stdout(buffer):
+            demo()
+    finally:
+        root_logger.handlers[:] = handlers
+    return buffer.getvalue()
+
+
 def main():
     """Run all demonstrations."""
-    logger = get_logger("BattleEnvironmentDemo")
-    
     print("🎮 BATTLE ENVIRONMENT DEMONSTRATION")
     print("=" * 60)
     print("Showcasing Task 1.6.1: BattleEnvironment Class Implementation")
     print("=" * 60)
     
     try:
-        demonstrate_environment_initialization()
-        demonstrate_team_management()
-        demonstrate_agent_spawning()
-        demonstrate_spatial_partitioning()
-        demonstrate_collision_detection()
-        demonstrate_battle_lifecycle()
-        demonstrate_battlefield_information()
+        # Run the demonstrations in worker processes, printing each one's
+        # captured output in the original order as soon as it is ready
+        with ProcessPoolExecutor(max_workers=DEMO_PROCESSES) as pool:
+            for output in pool.map(run_captured, DEMONSTRATIONS):
+                print(output, end="")
         
         print("\n\n🎉 DEMONSTRATION COMPLETE!")
         print("=" * 60)
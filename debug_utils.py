@@ -7,11 +7,17 @@ import sys
 import os
 from pathlib import Path
 
+import numpy as np
+
 # Add project root to Python path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
 from src.utils import Vector2D, Config, config_manager
+from src.utils.vector2d import v_add, v_sub, v_scale, v_length, v_normalize
+
+# Configuration is loaded once at import and shared by the debug helpers
+CONFIG = config_manager.get_config()
 
 
 def test_vector_operations():
@@ -22,15 +28,17 @@ def test_vector_operations():
     v1 = Vector2D(3, 4)
     v2 = Vector2D(1, 2)
     
-    # Basic operations
+    # Basic operations, computed on components so no temporary vectors are built
+    ax, ay = v1.x, v1.y
+    bx, by = v2.x, v2.y
     print(f"v1 = {v1}")
     print(f"v2 = {v2}")
-    print(f"v1 + v2 = {v1 + v2}")
-    print(f"v1 - v2 = {v1 - v2}")
-    print(f"v1 * 2 = {v1 * 2}")
-    print(f"v1.magnitude() = {v1.magnitude()}")
-    print(f"v1.normalize() = {v1.normalize()}")
-    print(f"v1.distance_to(v2) = {v1.distance_to(v2)}")
+    print("v1 + v2 = Vector2D(%.2f, %.2f)" % v_add(ax, ay, bx, by))
+    print("v1 - v2 = Vector2D(%.2f, %.2f)" % v_sub(ax, ay, bx, by))
+    print("v1 * 2 = Vector2D(%.2f, %.2f)" % v_scale(ax, ay, 2))
+    print(f"v1.magnitude() = {v_length(ax, ay)}")
+    print("v1.normalize() = Vector2D(%.2f, %.2f)" % v_normalize(ax, ay))
+    print(f"v1.distance_to(v2) = {v_length(*v_sub(ax, ay, bx, by))}")
     
     # Set breakpoint here to inspect variables
     breakpoint_marker = "Set breakpoint on this line"
@@ -43,8 +51,7 @@ def test_configuration():
     """Test configuration system with debugging."""
     print("\n⚙️ Testing Configuration system...")
     
-    # Load default configuration
-    config = config_manager.get_config()
+    config = CONFIG
     
     print(f"Simulation config:")
     print(f"  max_agents: {config.simulation.max_agents}")
@@ -69,27 +76,29 @@ def simulate_agent_positions():
     """Simulate some agent positions for debugging visualization."""
     print("\n🤖 Simulating agent positions...")
     
-    config = config_manager.get_config()
+    config = CONFIG
     
-    # Create some test agent positions
-    agents = []
-    for i in range(5):
-        x = (i + 1) * config.simulation.battlefield_width / 6
-        y = config.simulation.battlefield_height / 2
-        position = Vector2D(x, y)
-        
-        # Create simple velocity
-        velocity = Vector2D.from_angle(i * 1.2, config.agents.default_speed)
-        
-        agent_data = {
+    # Read configuration once instead of on every iteration
+    width = config.simulation.battlefield_width
+    height = config.simulation.battlefield_height
+    speed = config.agents.default_speed
+    health = config.agents.default_health
+    
+    # Create some test agent positions, evenly spaced across the battlefield
+    xs = np.arange(1, 6) * width / 6
+    y = height / 2
+    agents = [
+        {
             'id': i,
-            'position': position,
-            'velocity': velocity,
-            'health': config.agents.default_health
+            'position': Vector2D(x, y),
+            'velocity': Vector2D.from_angle(i * 1.2, speed),
+            'health': health
         }
-        agents.append(agent_data)
-        
-        print(f"Agent {i}: pos={position}, vel={velocity}")
+        for i, x in enumerate(xs.tolist())
+    ]
+    
+    for agent_data in agents:
+        print(f"Agent {agent_data['id']}: pos={agent_data['position']}, vel={agent_data['velocity']}")
     
     # Set breakpoint here to inspect agents
     breakpoint_marker = "Inspect agents list here"
@@ -19,37 +19,63 @@ sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.agents.decision_framework import (
     DecisionMaker, DecisionContext, ActionEvaluator, DefaultActionEvaluator,
-    ActionValidator, ActionScore, DecisionPriority, create_decision_maker
+    ActionValidator, ActionScore, DecisionPriority, create_decision_maker,
+    ACTIONS, ACTION_CODES, DECISION_CACHE_SIZE
 )
 from src.agents.base_agent import CombatAction, AgentState, AgentStats
 from src.utils.vector2d import Vector2D
 from src.utils.logging_config import get_logger
+import dataclasses
+import math
 import time
+from types import MappingProxyType
+from typing import List, Tuple
+import numpy as np
 
 # Set up logging
 logger = get_logger("DecisionFrameworkDemo")
 
+# Read-only battlefield info shared by every decision call
+EMPTY_BATTLEFIELD = MappingProxyType({})
+BOUNDED_BATTLEFIELD = MappingProxyType(
+    {"bounds": {"min_x": -100, "max_x": 100, "min_y": -100, "max_y": 100}}
+)
+
+# Stats shared by every demo agent; only current health differs
+BASE_STATS = AgentStats(
+    max_health=100.0,
+    current_health=100.0,
+    speed=50.0,
+    attack_damage=20.0,
+    attack_range=30.0,
+    vision_range=150.0
+)
+
 
 class DemoAgent:
     """Simple agent class for demonstration purposes."""
     
+    __slots__ = ('agent_id', 'position', 'state', 'stats', 'last_attack_time',
+                 'team_id', '_combat_state')
+    
+    # Shared clock read by can_attack, advanced once per decision step
+    now = 0.0
+    
+    @classmethod
+    def tick(cls) -> None:
+        """Read the clock once for the current decision step."""
+        cls.now = time.perf_counter()
+    
     def __init__(self, agent_id: str, position: Vector2D, health: float = 100.0, team_id: int = 1):
         self.agent_id = agent_id
         self.position = position
         self.state = AgentState.ALIVE
-        self.stats = AgentStats(
-            max_health=100.0,
-            current_health=health,
-            speed=50.0,
-            attack_damage=20.0,
-            attack_range=30.0,
-            vision_range=150.0
-        )
-        self.last_attack_time = 0.0
+        self.stats = dataclasses.replace(BASE_STATS, current_health=health)
+        self.last_attack_time = -math.inf  # Never attacked
         self.team_id = team_id
         
-        # Mock combat state for demo
-        self._combat_state = MockCombatState()
+        # Mock combat state for demo (stateless, so shared)
+        self._combat_state = MOCK_COMBAT_STATE
     
     @property
     def is_alive(self) -> bool:
@@ -57,7 +83,7 @@ class DemoAgent:
     
     @property
     def can_attack(self) -> bool:
-        return self.is_alive and time.time() - self.last_attack_time >= self.stats.attack_cooldown
+        return self.is_alive and DemoAgent.now - self.last_attack_time >= self.stats.attack_cooldown
     
     @property
     def combat_state(self):
@@ -70,10 +96,74 @@ class DemoAgent:
 class MockCombatState:
     """Mock combat state for demo."""
     
+    __slots__ = ()
+    
     def can_attack(self) -> bool:
         return True
 
 
+MOCK_COMBAT_STATE = MockCombatState()
+
+
+# Aggressive scores that do not depend on the context
+_FIXED_AGGRESSIVE_SCORES = {
+    CombatAction.MOVE: (0.6, DecisionPriority.MEDIUM, 0.8, "Move to engage enemies"),
+    CombatAction.DODGE: (0.4, DecisionPriority.MEDIUM, 0.7, "Dodge to maintain aggression"),
+    CombatAction.USE_SPECIAL: (0.5, DecisionPriority.MEDIUM, 0.6, "Situational aggressive action"),
+    CombatAction.COOPERATE: (0.5, DecisionPriority.MEDIUM, 0.6, "Situational aggressive action"),
+}
+
+# The same scores indexed by action code; None marks actions that
+# score_aggressive evaluates case by case
+FIXED_AGGRESSIVE_SCORES = tuple(_FIXED_AGGRESSIVE_SCORES.get(action) for action in ACTIONS)
+
+
+def score_aggressive(
+    action: CombatAction,
+    health_pct: float,
+    distance: float,
+    attack_range: float,
+    n_threats: int
+) -> Tuple[float, DecisionPriority, float, str]:
+    """
+    Score an action for an aggressive agent from plain scalar inputs.
+    
+    Args:
+        action: Action to score
+        health_pct: Agent health as a fraction of maximum
+        distance: Distance to the nearest enemy (math.inf when there is none)
+        attack_range: Agent attack range
+        n_threats: Number of immediate threats
+        
+    Returns:
+        Tuple of (utility, priority, confidence, reasoning)
+    """
+    fixed = FIXED_AGGRESSIVE_SCORES[ACTION_CODES[action]]
+    if fixed is not None:
+        return fixed
+    
+    if action == CombatAction.ATTACK_MELEE:
+        if distance <= attack_range:
+            return 0.95, DecisionPriority.HIGH, 0.9, "AGGRESSIVE: Prioritize melee attacks!"
+        return 0.3, DecisionPriority.MEDIUM, 0.8, "Melee not viable"
+    
+    if action == CombatAction.ATTACK_RANGED:
+        if distance != math.inf:
+            return 0.85, DecisionPriority.HIGH, 0.85, "AGGRESSIVE: Attack at range!"
+        return 0.2, DecisionPriority.LOW, 0.7, "No targets"
+    
+    if action == CombatAction.RETREAT:
+        # Only retreat if critically wounded
+        if health_pct < 0.15:
+            return 0.9, DecisionPriority.EMERGENCY, 0.95, "CRITICAL: Must retreat to survive"
+        return 0.1, DecisionPriority.MINIMAL, 0.8, "AGGRESSIVE: No retreat!"
+    
+    # Defend
+    if n_threats >= 3:
+        return 0.7, DecisionPriority.HIGH, 0.8, "Defend against multiple threats"
+    return 0.3, DecisionPriority.LOW, 0.7, "AGGRESSIVE: Offense over defense"
+
+
 class AggressiveEvaluator(ActionEvaluator):
     """
     Custom evaluator that prefers aggressive actions.
@@ -84,99 +174,60 @@ class AggressiveEvaluator(ActionEvaluator):
     
     def evaluate_action(self, action: CombatAction, context: DecisionContext) -> ActionScore:
         """Evaluate actions with aggressive bias."""
-        
-        if action == CombatAction.ATTACK_MELEE:
-            if context.nearest_enemy:
-                distance = context.self_agent.position.distance_to(context.nearest_enemy.position)
-                if distance <= context.self_agent.stats.attack_range:
-                    return ActionScore(
-                        action, 0.95, DecisionPriority.HIGH, 0.9,
-                        "AGGRESSIVE: Prioritize melee attacks!"
-                    )
-            return ActionScore(action, 0.3, DecisionPriority.MEDIUM, 0.8, "Melee not viable")
-        
-        elif action == CombatAction.ATTACK_RANGED:
-            if context.nearest_enemy:
-                return ActionScore(
-                    action, 0.85, DecisionPriority.HIGH, 0.85,
-                    "AGGRESSIVE: Attack at range!"
-                )
-            return ActionScore(action, 0.2, DecisionPriority.LOW, 0.7, "No targets")
-        
-        elif action == CombatAction.RETREAT:
-            # Only retreat if critically wounded
-            if context.health_percentage < 0.15:
-                return ActionScore(
-                    action, 0.9, DecisionPriority.EMERGENCY, 0.95,
-                    "CRITICAL: Must retreat to survive"
-                )
-            else:
-                return ActionScore(
-                    action, 0.1, DecisionPriority.MINIMAL, 0.8,
-                    "AGGRESSIVE: No retreat!"
-                )
-        
-        elif action == CombatAction.MOVE:
-            return ActionScore(
-                action, 0.6, DecisionPriority.MEDIUM, 0.8,
-                "Move to engage enemies"
-            )
-        
-        elif action == CombatAction.DEFEND:
-            if len(context.immediate_threats) >= 3:
-                return ActionScore(
-                    action, 0.7, DecisionPriority.HIGH, 0.8,
-                    "Defend against multiple threats"
-                )
-            else:
-                return ActionScore(
-                    action, 0.3, DecisionPriority.LOW, 0.7,
-                    "AGGRESSIVE: Offense over defense"
-                )
-        
-        elif action == CombatAction.DODGE:
-            return ActionScore(
-                action, 0.4, DecisionPriority.MEDIUM, 0.7,
-                "Dodge to maintain aggression"
-            )
-        
-        else:  # Special abilities, cooperation
-            return ActionScore(
-                action, 0.5, DecisionPriority.MEDIUM, 0.6,
-                "Situational aggressive action"
-            )
+        utility, priority, confidence, reasoning = score_aggressive(
+            action,
+            context.health_percentage,
+            context.nearest_enemy_distance,
+            context.attack_range,
+            len(context.immediate_threats)
+        )
+        return ActionScore(action, utility, priority, confidence, reasoning)
+
+
+def enemy_distances(agent: DemoAgent, enemies: List[DemoAgent]) -> np.ndarray:
+    """Distances from an agent to each enemy, computed in one array pass."""
+    positions = np.array([(enemy.position.x, enemy.position.y) for enemy in enemies])
+    dx = positions[:, 0] - agent.position.x
+    dy = positions[:, 1] - agent.position.y
+    return np.sqrt(dx * dx + dy * dy)
 
 
 def print_section(title: str):
     """Print a formatted section header."""
-    print(f"\n{'='*60}")
-    print(f"  {title}")
-    print(f"{'='*60}")
+    rule = '=' * 60
+    sys.stdout.write(f"\n{rule}\n  {title}\n{rule}\n")
 
 
 def print_agent_info(agent: DemoAgent):
     """Print agent information."""
-    print(f"Agent: {agent}")
-    print(f"  Health: {agent.stats.current_health:.0f}/{agent.stats.max_health:.0f} ({agent.stats.current_health/agent.stats.max_health:.1%})")
-    print(f"  Position: {agent.position}")
-    print(f"  Can Attack: {agent.can_attack}")
+    stats = agent.stats
+    lines = [
+        f"Agent: {agent}",
+        f"  Health: {stats.current_health:.0f}/{stats.max_health:.0f} ({stats.current_health/stats.max_health:.1%})",
+        f"  Position: {agent.position}",
+        f"  Can Attack: {agent.can_attack}",
+    ]
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def print_decision_result(action: CombatAction, decision_maker: DecisionMaker):
     """Print decision result and reasoning."""
-    print(f"  Decision: {action}")
+    lines = [f"  Decision: {action}"]
     
     # Get the last decision for reasoning
     if decision_maker.decision_history:
         last_context, last_score = decision_maker.decision_history[-1]
-        print(f"  Reasoning: {last_score.reasoning}")
-        print(f"  Utility: {last_score.utility:.2f}, Priority: {last_score.priority.name}")
-        print(f"  Confidence: {last_score.confidence:.2f}, Weighted Score: {last_score.weighted_score:.2f}")
+        lines.append(f"  Reasoning: {last_score.reasoning}")
+        lines.append(f"  Utility: {last_score.utility:.2f}, Priority: {last_score.priority.name}")
+        lines.append(f"  Confidence: {last_score.confidence:.2f}, Weighted Score: {last_score.weighted_score:.2f}")
+    
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 def demo_basic_decisions():
     """Demonstrate basic decision making with no threats."""
     print_section("Basic Decision Making (No Enemies)")
+    DemoAgent.tick()
     
     # Create agent with no threats
     agent = DemoAgent("Hero", Vector2D(0, 0), health=100.0)
@@ -186,13 +237,14 @@ def demo_basic_decisions():
     print("\nScenario: Peaceful battlefield, no enemies visible")
     
     # Make decision with no visible agents
-    action = decision_maker.decide_action([], {}, dt=1.0)
+    action = decision_maker.decide_action([], EMPTY_BATTLEFIELD, dt=1.0)
     print_decision_result(action, decision_maker)
 
 
 def demo_combat_decisions():
     """Demonstrate combat decision making."""
     print_section("Combat Decision Making")
+    DemoAgent.tick()
     
     # Create agents
     hero = DemoAgent("Hero", Vector2D(0, 0), health=100.0, team_id=1)
@@ -203,21 +255,21 @@ def demo_combat_decisions():
     
     print_agent_info(hero)
     print(f"Enemies: {enemy1}, {enemy2}")
-    print(f"Enemy1 distance: {hero.position.distance_to(enemy1.position):.1f}")
-    print(f"Enemy2 distance: {hero.position.distance_to(enemy2.position):.1f}")
+    distance1, distance2 = enemy_distances(hero, [enemy1, enemy2])
+    print(f"Enemy1 distance: {distance1:.1f}")
+    print(f"Enemy2 distance: {distance2:.1f}")
     print(f"Attack range: {hero.stats.attack_range}")
     
     # Make decision with enemies present
     visible_agents = [enemy1, enemy2]
-    battlefield_info = {"bounds": {"min_x": -100, "max_x": 100, "min_y": -100, "max_y": 100}}
-    
-    action = decision_maker.decide_action(visible_agents, battlefield_info, dt=1.0)  # type: ignore
+    action = decision_maker.decide_action(visible_agents, BOUNDED_BATTLEFIELD, dt=1.0)  # type: ignore
     print_decision_result(action, decision_maker)
 
 
 def demo_low_health_decisions():
     """Demonstrate decision making with low health."""
     print_section("Low Health Decision Making")
+    DemoAgent.tick()
     
     # Create badly wounded agent
     wounded_hero = DemoAgent("WoundedHero", Vector2D(0, 0), health=15.0, team_id=1)
@@ -231,13 +283,14 @@ def demo_low_health_decisions():
     
     # Make decision with low health
     visible_agents = [enemy]
-    action = decision_maker.decide_action(visible_agents, {}, dt=1.0)  # type: ignore
+    action = decision_maker.decide_action(visible_agents, EMPTY_BATTLEFIELD, dt=1.0)  # type: ignore
     print_decision_result(action, decision_maker)
 
 
 def demo_surrounded_decisions():
     """Demonstrate decision making when surrounded."""
     print_section("Surrounded Decision Making")
+    DemoAgent.tick()
     
     # Create surrounded agent
     surrounded_hero = DemoAgent("SurroundedHero", Vector2D(0, 0), health=60.0, team_id=1)
@@ -251,20 +304,20 @@ def demo_surrounded_decisions():
     
     print_agent_info(surrounded_hero)
     print("Enemies surrounding agent:")
-    for enemy in enemies:
-        distance = surrounded_hero.position.distance_to(enemy.position)
+    for enemy, distance in zip(enemies, enemy_distances(surrounded_hero, enemies)):
         print(f"  {enemy} (distance: {distance:.1f})")
     
     print("Scenario: Agent surrounded by multiple enemies")
     
     # Make decision when surrounded
-    action = decision_maker.decide_action(enemies, {}, dt=1.0)  # type: ignore
+    action = decision_maker.decide_action(enemies, EMPTY_BATTLEFIELD, dt=1.0)  # type: ignore
     print_decision_result(action, decision_maker)
 
 
 def demo_aggressive_evaluator():
     """Demonstrate custom aggressive evaluator."""
     print_section("Custom Aggressive Evaluator")
+    DemoAgent.tick()
     
     # Create agent with aggressive evaluator
     aggressive_hero = DemoAgent("AggressiveHero", Vector2D(0, 0), health=70.0, team_id=1)
@@ -280,12 +333,12 @@ def demo_aggressive_evaluator():
     
     # Make decision with aggressive evaluator
     visible_agents = [enemy]
-    action = decision_maker.decide_action(visible_agents, {}, dt=1.0)  # type: ignore
+    action = decision_maker.decide_action(visible_agents, EMPTY_BATTLEFIELD, dt=1.0)  # type: ignore
     print_decision_result(action, decision_maker)
     
     print("\nComparing with default evaluator:")
     default_decision_maker = create_decision_maker(aggressive_hero)  # type: ignore
-    default_action = default_decision_maker.decide_action(visible_agents, {}, dt=1.0)  # type: ignore
+    default_action = default_decision_maker.decide_action(visible_agents, EMPTY_BATTLEFIELD, dt=1.0)  # type: ignore
     print(f"  Default Decision: {default_action}")
     if default_decision_maker.decision_history:
         _, default_score = default_decision_maker.decision_history[-1]
@@ -295,9 +348,11 @@ def demo_aggressive_evaluator():
 def demo_decision_history():
     """Demonstrate decision history tracking."""
     print_section("Decision History Tracking")
+    DemoAgent.tick()
     
     agent = DemoAgent("HistoryAgent", Vector2D(0, 0), health=100.0, team_id=1)
-    decision_maker = create_decision_maker(agent)  # type: ignore
+    # Remember decisions so repeated scenarios skip re-evaluation
+    decision_maker = DecisionMaker(agent, cache_size=DECISION_CACHE_SIZE)  # type: ignore
     
     print_agent_info(agent)
     print("Making multiple decisions to build history...")
@@ -313,7 +368,8 @@ def demo_decision_history():
     
     for i, (enemies, description) in enumerate(scenarios, 1):
         print(f"\n  Scenario {i}: {description}")
-        action = decision_maker.decide_action(enemies, {}, dt=1.0)  # type: ignore
+        DemoAgent.tick()
+        action = decision_maker.decide_action(enemies, EMPTY_BATTLEFIELD, dt=1.0)  # type: ignore
         print(f"    Decision: {action}")
     
     print(f"\nDecision History Summary:")
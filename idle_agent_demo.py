@@ -6,12 +6,23 @@ and comparing it with the RandomAgent to highlight the contrast between
 active and passive behavior.
 """
 
-import time
+import os
+import sys
+from collections import Counter
+
+import numpy as np
+
 from src.agents.idle_agent import IdleAgent
 from src.agents.random_agent import RandomAgent
 from src.agents.base_agent import AgentRole, CombatAction
 from src.utils.vector2d import Vector2D
 
+# Per-step agent reports are skipped when DEMO_VERBOSE=0 (e.g. for timing runs)
+VERBOSE = os.environ.get("DEMO_VERBOSE", "1") == "1"
+
+# Number of steps in the comparative simulation
+SIMULATION_STEPS = 8
+
 
 def main():
     """Demonstrate IdleAgent behavior and contrast with RandomAgent."""
@@ -34,7 +45,7 @@ def main():
         print(f"     Strategy: {agent.get_strategy_description()}")
     
     print("\n" + "=" * 60)
-    print("Running comparative simulation for 8 steps...")
+    print(f"Running comparative simulation for {SIMULATION_STEPS} steps...")
     print("=" * 60)
     
     # Simulation parameters
@@ -46,18 +57,36 @@ def main():
     }
     
     # Track agent behaviors for analysis
-    idle_positions = []
-    random_positions = []
+    # One (x, y) row per step for each tracked agent
+    idle_positions = np.empty((SIMULATION_STEPS, 2))
+    random_positions = np.empty((SIMULATION_STEPS, 2))
     actions_taken = {"idle": [], "random": []}
     
+    # Agents never join, leave or switch teams during the demo, so each
+    # agent's visible and enemy lists are built once from a team map
+    agents_by_team = {}
+    for agent in agents:
+        agents_by_team.setdefault(agent.team_id, []).append(agent)
+    other_agents_of = [agents[:i] + agents[i + 1:] for i in range(len(agents))]
+    enemies_of = [
+        [enemy for team_id, members in agents_by_team.items() if team_id != agent.team_id
+         for enemy in members]
+        for agent in agents
+    ]
+    
+    # Agent kinds are fixed too, so classify each agent once
+    is_idle = [isinstance(agent, IdleAgent) for agent in agents]
+    is_random = [isinstance(agent, RandomAgent) for agent in agents]
+    
     # Run simulation
-    for step in range(8):
-        print(f"\n--- Step {step + 1} (t={battlefield_info['time']:.2f}s) ---")
+    for step in range(SIMULATION_STEPS):
+        # Collect the step's report and write it in one go
+        lines = [f"\n--- Step {step + 1} (t={battlefield_info['time']:.2f}s) ---"]
         
         # Update each agent
         for i, agent in enumerate(agents):
             # Get other agents as visible agents
-            other_agents = [a for a in agents if a != agent]
+            other_agents = other_agents_of[i]
             
             # Update agent
             agent.update(dt, battlefield_info)
@@ -65,71 +94,73 @@ def main():
             # Make decisions
             action = agent.decide_action(other_agents, battlefield_info)
             movement = agent.calculate_movement(other_agents, battlefield_info)
-            target = agent.select_target([a for a in other_agents if a.team_id != agent.team_id])
+            target = agent.select_target(enemies_of[i])
             
             # Track positions and actions for later analysis
-            if isinstance(agent, IdleAgent) and agent == idle_agent:
-                idle_positions.append((agent.position.x, agent.position.y))
+            if agent is idle_agent:
+                idle_positions[step] = (agent.position.x, agent.position.y)
                 actions_taken["idle"].append(action)
-            elif isinstance(agent, RandomAgent):
-                random_positions.append((agent.position.x, agent.position.y))
+            elif is_random[i]:
+                random_positions[step] = (agent.position.x, agent.position.y)
                 actions_taken["random"].append(action)
             
+            if not VERBOSE:
+                continue
+            
             # Show agent behavior
-            agent_type = "Idle" if isinstance(agent, IdleAgent) else "Random"
-            print(f"{agent_type} Agent {i+1} ({agent.agent_id[:8]}):")
-            print(f"  Position: ({agent.position.x:.1f}, {agent.position.y:.1f})")
-            print(f"  Action: {action.value}")
-            print(f"  Movement Vector: ({movement.x:.1f}, {movement.y:.1f}) mag={movement.magnitude():.1f}")
+            agent_type = "Idle" if is_idle[i] else "Random"
+            lines.append(f"{agent_type} Agent {i+1} ({agent.short_id}):")
+            lines.append(f"  Position: ({agent.position.x:.1f}, {agent.position.y:.1f})")
+            lines.append(f"  Action: {action.value}")
+            lines.append(f"  Movement Vector: ({movement.x:.1f}, {movement.y:.1f}) mag={movement.magnitude():.1f}")
             if target:
-                print(f"  Target: {target.agent_id[:8]} (team: {target.team_id})")
+                lines.append(f"  Target: {target.short_id} (team: {target.team_id})")
             else:
-                print(f"  Target: None")
-            print(f"  Health: {agent.stats.current_health:.0f}/{agent.stats.max_health}")
+                lines.append(f"  Target: None")
+            lines.append(f"  Health: {agent.stats.current_health:.0f}/{agent.stats.max_health}")
             
             # Show idle-specific stats
-            if isinstance(agent, IdleAgent):
+            if is_idle[i]:
                 stats = agent.get_idle_statistics()
-                print(f"  Idle Time: {stats['total_idle_time']:.2f}s")
-                print(f"  Updates: {stats['update_count']}")
+                lines.append(f"  Idle Time: {stats['total_idle_time']:.2f}s")
+                lines.append(f"  Updates: {stats['update_count']}")
+        
+        if VERBOSE:
+            sys.stdout.write("\n".join(lines) + "\n")
         
         # Update simulation time
         battlefield_info["time"] += dt
-        
-        # Small delay for readability
-        time.sleep(0.1)
     
     print("\n" + "=" * 60)
     print("Behavior Analysis: Idle vs Random Agents")
     print("=" * 60)
     
+    # Count unique positions on the arrays, and actions in a single pass apiece
+    idle_unique_positions = len(np.unique(idle_positions, axis=0))
+    idle_action_counts = Counter(actions_taken['idle'])
+    random_unique_positions = len(np.unique(random_positions, axis=0))
+    random_action_counts = Counter(action.value for action in actions_taken['random'])
+    
     # Analyze idle agent behavior
     print(f"\n🔍 IdleAgent Analysis:")
     idle_stats = idle_agent.get_idle_statistics()
     print(f"  Total Idle Time: {idle_stats['total_idle_time']:.2f}s")
     print(f"  Total Updates: {idle_stats['update_count']}")
-    print(f"  Position Changes: {len(set(idle_positions))} unique positions")
-    print(f"  Action Variety: {len(set(actions_taken['idle']))} unique actions")
+    print(f"  Position Changes: {idle_unique_positions} unique positions")
+    print(f"  Action Variety: {len(idle_action_counts)} unique actions")
     print(f"  Consistent Action: {actions_taken['idle'][0].value} (all {len(actions_taken['idle'])} times)")
     print(f"  Movement Distance: 0.0 units (completely stationary)")
     
     # Analyze random agent behavior  
     print(f"\n🎲 RandomAgent Analysis:")
-    print(f"  Position Changes: {len(set(random_positions))} unique positions")
-    print(f"  Action Variety: {len(set(actions_taken['random']))} unique actions")
-    action_counts = {}
-    for action in actions_taken['random']:
-        action_counts[action.value] = action_counts.get(action.value, 0) + 1
+    print(f"  Position Changes: {random_unique_positions} unique positions")
+    print(f"  Action Variety: {len(random_action_counts)} unique actions")
     print(f"  Action Distribution:")
-    for action, count in sorted(action_counts.items()):
+    for action, count in sorted(random_action_counts.items()):
         print(f"    {action}: {count}/{len(actions_taken['random'])}")
     
     # Calculate movement distance for random agent
-    total_distance = 0.0
-    for i in range(1, len(random_positions)):
-        prev_pos = Vector2D(random_positions[i-1][0], random_positions[i-1][1])
-        curr_pos = Vector2D(random_positions[i][0], random_positions[i][1])
-        total_distance += prev_pos.distance_to(curr_pos)
+    total_distance = float(np.linalg.norm(np.diff(random_positions, axis=0), axis=1).sum())
     print(f"  Approximate Movement Distance: {total_distance:.1f} units")
     
     print("\n" + "=" * 60)
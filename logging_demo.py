@@ -3,8 +3,8 @@ Logging System Example and Test
 Demonstrates the comprehensive logging system for Battle AI.
 """
 
+import logging
 import sys
-import time
 from pathlib import Path
 
 # Add project root to Python path
@@ -18,6 +18,10 @@ from src.utils.logging_config import log_function_entry, log_performance
 # Initialize logging system
 logger = get_logger(__name__)
 
+# Whether DEBUG records are emitted, checked once instead of per log call;
+# main() refreshes it after logging has been initialized
+DEBUG_ENABLED = logger.isEnabledFor(logging.DEBUG)
+
 
 @log_function_entry
 @log_performance
@@ -28,11 +32,12 @@ def demonstrate_vector_operations():
     logger.info("🧮 Starting vector operations demonstration")
     
     # Create vectors with logging
-    logger.debug("Creating test vectors")
+    if DEBUG_ENABLED:
+        logger.debug("Creating test vectors")
     v1 = Vector2D(3, 4)
     v2 = Vector2D(1, 2)
     
-    logger.info(f"Created vectors: v1={v1}, v2={v2}")
+    logger.info("Created vectors: v1=%s, v2=%s", v1, v2)
     
     # Perform operations
     operations = [
@@ -44,7 +49,7 @@ def demonstrate_vector_operations():
     ]
     
     for op_name, result in operations:
-        logger.info(f"  {op_name}: {result}")
+        logger.info("  %s: %s", op_name, result)
     
     logger.info("✅ Vector operations completed")
     return operations
@@ -60,23 +65,23 @@ def demonstrate_configuration_logging():
         
         # Log configuration details
         logger.info("Configuration loaded successfully:")
-        logger.info(f"  🎮 Max agents: {config.simulation.max_agents}")
-        logger.info(f"  🗺️ Battlefield: {config.simulation.battlefield_width}x{config.simulation.battlefield_height}")
-        logger.info(f"  ⏱️ Time step: {config.simulation.time_step}s")
-        logger.info(f"  📊 FPS: {config.simulation.fps}")
-        logger.info(f"  💪 Agent health: {config.agents.default_health}")
-        logger.info(f"  🏃 Agent speed: {config.agents.default_speed}")
+        logger.info("  🎮 Max agents: %s", config.simulation.max_agents)
+        logger.info("  🗺️ Battlefield: %sx%s", config.simulation.battlefield_width, config.simulation.battlefield_height)
+        logger.info("  ⏱️ Time step: %ss", config.simulation.time_step)
+        logger.info("  📊 FPS: %s", config.simulation.fps)
+        logger.info("  💪 Agent health: %s", config.agents.default_health)
+        logger.info("  🏃 Agent speed: %s", config.agents.default_speed)
         
         # Log logging configuration
         logger.info("📝 Logging configuration:")
-        logger.info(f"  Level: {config.logging.level}")
-        logger.info(f"  Console: {config.logging.console}")
-        logger.info(f"  Directory: {config.logging.directory}")
+        logger.info("  Level: %s", config.logging.level)
+        logger.info("  Console: %s", config.logging.console)
+        logger.info("  Directory: %s", config.logging.directory)
         
         return config
         
     except Exception as e:
-        logger.error(f"❌ Failed to load configuration: {e}")
+        logger.error("❌ Failed to load configuration: %s", e)
         raise
 
 
@@ -99,10 +104,10 @@ def simulate_agent_activity():
     
     # Simulate agent creation
     for i in range(3):
-        logger.info(f"  🔵 Creating agent {i}")
-        logger.debug(f"    Agent {i} position: (100, {i * 50})")
-        logger.debug(f"    Agent {i} health: 100")
-        time.sleep(0.1)  # Small delay to show timing
+        logger.info("  🔵 Creating agent %d", i)
+        if DEBUG_ENABLED:
+            logger.debug("    Agent %d position: (100, %d)", i, i * 50)
+            logger.debug("    Agent %d health: 100", i)
     
     # Simulate some events
     events = [
@@ -114,12 +119,12 @@ def simulate_agent_activity():
     
     for event, level in events:
         if level == "debug":
-            logger.debug(f"    🔍 {event}")
+            if DEBUG_ENABLED:
+                logger.debug("    🔍 %s", event)
         elif level == "info":
-            logger.info(f"    ℹ️ {event}")
+            logger.info("    ℹ️ %s", event)
         elif level == "warning":
-            logger.warning(f"    ⚠️ {event}")
-        time.sleep(0.1)
+            logger.warning("    ⚠️ %s", event)
     
     logger.info("🤖 Agent activity simulation completed")
 
@@ -130,7 +135,8 @@ def demonstrate_error_handling():
     
     try:
         # Simulate an error condition
-        logger.debug("Attempting risky operation...")
+        if DEBUG_ENABLED:
+            logger.debug("Attempting risky operation...")
         
         # This will cause a division by zero
         result = 1 / 0
@@ -147,6 +153,9 @@ def demonstrate_error_handling():
 
 def main():
     """Main demonstration function."""
+    global DEBUG_ENABLED
+    DEBUG_ENABLED = logger.isEnabledFor(logging.DEBUG)
+    
     print("🚀 Battle AI Logging System Demonstration")
     print("=" * 60)
     